@@ -1,18 +1,116 @@
 #!/usr/bin/env python3
-"""Short helper: gather today's ground truth, return JSON for MCP"""
-import os, json, subprocess
+"""Short helper: gather today's ground truth, return JSON for MCP
+
+Usage: activity-helper.py [--content]   # --content adds per-file summaries
+"""
+import os, re, sys, json, subprocess
 from datetime import datetime
 from pathlib import Path
 
 PSI = os.path.expanduser("~/Code/github.com/laris-co/Nat-s-Agents/ψ")
 REPO = os.path.expanduser("~/Code/github.com/laris-co/Nat-s-Agents")
+CACHE = Path(os.path.expanduser("~/.cache/oracle-v2/activity-summaries.json"))
+MAX_LINE = 4096      # bytes of any single line we parse (rest still hashed)
+MAX_HEADINGS = 50
+
+HEADING = re.compile(r'(#{1,6})\s+(\S.*)')
+CHUNK = 1 << 16      # bytes scanned at a time
+
+_memo, _dirty, _seen = None, False, set()
+
+def _load_memo():
+    """Memo of summaries keyed by path, valid while (mtime, size) match"""
+    global _memo
+    if _memo is None:
+        try: _memo = json.loads(CACHE.read_text())
+        except (OSError, ValueError): _memo = {}
+    return _memo
+
+def _save_memo():
+    """Write back only this run's files, so the cache never outgrows a day"""
+    if _memo is None or (not _dirty and _seen == set(_memo)): return
+    try:
+        CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE.with_suffix('.tmp')
+        tmp.write_text(json.dumps({k: v for k, v in _memo.items() if k in _seen}))
+        os.replace(tmp, CACHE)
+    except OSError: pass
+
+def summarize(f):
+    """Stream one .md file via mmap in CHUNK slices: title, frontmatter, words, headings, sha1
+
+    Only the first MAX_LINE bytes of a line are kept for parsing; words of
+    longer lines are counted slice by slice, so memory stays bounded.
+    """
+    import mmap, hashlib  # --content only; keep default startup lean
+    h, fm, heads = hashlib.sha1(), {}, []
+    st = {"n": 0, "fm": False, "code": False, "title": None, "words": 0}
+
+    def end_line(head, line_words):
+        line, n = head.decode('utf-8', 'replace').rstrip(), st["n"]
+        st["n"] += 1
+        if n == 0 and line == '---': st["fm"] = True; return
+        if st["fm"]:
+            if line == '---': st["fm"] = False
+            elif ':' in line and not line.startswith(' '):
+                k, v = line.split(':', 1); fm[k.strip()] = v.strip().strip('"\'')
+            return
+        m = HEADING.match(line)
+        if line.startswith('```'): st["code"] = not st["code"]
+        elif not st["code"] and m:
+            level, text = len(m.group(1)), m.group(2).strip()
+            if st["title"] is None and level == 1: st["title"] = text
+            if len(heads) < MAX_HEADINGS: heads.append({"level": level, "text": text})
+        st["words"] += line_words
+
+    with open(f, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return {"title": f.stem, "frontmatter": {}, "words": 0, "headings": [], "sha1": h.hexdigest()}
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
+            head, line_words, in_word = b'', 0, False
+            for off in range(0, size, CHUNK):
+                for i, part in enumerate(mm[off:off + CHUNK].split(b'\n')):
+                    if i:  # newline: previous line is complete
+                        end_line(head, line_words)
+                        head, line_words, in_word = b'', 0, False
+                    if len(head) < MAX_LINE: head += part[:MAX_LINE - len(head)]
+                    toks = len(part.split())
+                    if toks and in_word and not part[:1].isspace(): toks -= 1  # word split across slices
+                    line_words += toks
+                    if part: in_word = not part[-1:].isspace()
+            end_line(head, line_words)
+    return {"title": fm.get("title") or st["title"] or f.stem, "frontmatter": fm,
+            "words": st["words"], "headings": heads, "sha1": h.hexdigest()}
+
+def cached_summary(f, st):
+    """summarize() memoized by (path, mtime, size) across runs"""
+    global _dirty
+    memo, key = _load_memo(), str(f)
+    _seen.add(key)
+    hit = memo.get(key)
+    if hit and hit["mtime"] == st.st_mtime and hit["size"] == st.st_size:
+        return hit["summary"]
+    s = summarize(f)
+    memo[key] = {"mtime": st.st_mtime, "size": st.st_size, "summary": s}
+    _dirty = True
+    return s
 
-def find_files(folder, date_str):
-    """Find .md files with date in name"""
+def find_files(folder, date_str, content=False):
+    """Find .md files with date in name (content=True adds a streamed summary)"""
     path = Path(PSI) / folder
     if not path.exists(): return []
-    return [{"path": str(f), "size": f.stat().st_size, "name": f.name}
-            for f in path.rglob("*.md") if date_str in f.name]
+    out = []
+    for f in path.rglob("*.md"):
+        if date_str not in f.name: continue
+        st = f.stat()
+        item = {"path": str(f), "size": st.st_size, "name": f.name}
+        if content:
+            try: item.update(cached_summary(f, st))
+            except OSError: pass
+        out.append(item)
+    return out
 
 def get_commits(date_str):
     """Get commits for date"""
@@ -25,12 +123,14 @@ def get_commits(date_str):
 
 def main():
     date = datetime.now().strftime('%Y-%m-%d')
+    content = '--content' in sys.argv[1:]
     print(json.dumps({
         "date": date,
-        "learnings": find_files("memory/learnings", date),
-        "retrospectives": find_files("memory/retrospectives", date),
-        "drafts": find_files("writing/drafts", date),
+        "learnings": find_files("memory/learnings", date, content),
+        "retrospectives": find_files("memory/retrospectives", date, content),
+        "drafts": find_files("writing/drafts", date, content),
         "commits": get_commits(date)
     }))
+    _save_memo()
 
 if __name__ == '__main__': main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Import-time budget + cold-start numbers for the Python helpers
+
+The helpers run as short-lived subprocesses, so interpreter start and
+imports dominate. Each command runs under `python -X importtime`. The hard
+gate is that no heavy module (torch/TTS/asyncio...) gets imported. As a
+coarse backstop, imports beyond a bare interpreter (best of N runs) must
+stay under a budget set ~3x above local numbers, so shared CI runners do
+not flake. Median wall-clock cold start is reported alongside.
+
+Usage: import-budget.py [--runs N] [--json]
+Exit 1 when a budget is exceeded or a forbidden module is imported.
+"""
+import os, sys, json, time, tempfile, statistics, subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PY = sys.executable
+
+# name -> (argv, import budget in ms, modules that must stay lazy)
+# Budgets are ~3x the local best-of-N (~30ms) - a regression tripwire, not a target
+HEAVY = {"torch", "torchaudio", "TTS", "numpy", "soundfile", "edge_tts", "asyncio"}
+COMMANDS = {
+    "activity-helper": (["scripts/activity-helper.py"], 100, HEAVY | {"mmap", "hashlib"}),
+    "robin_daily check": (["ψ/lib/robin-daily/robin_daily.py", "check", "--no-voice"], 100, HEAVY | {"robin_voice"}),
+    "robin_voice --list-voices": (["ψ/wealth-council/ψ/lib/robin-voice/robin_voice.py", "--list-voices"], 100, HEAVY),
+}
+
+def run(argv, env, importtime=False):
+    """Run once; return (wall ms, stderr)"""
+    cmd = [PY] + (["-X", "importtime"] if importtime else []) + argv
+    t = time.perf_counter()
+    r = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True)
+    return (time.perf_counter() - t) * 1000, r.stderr
+
+def parse_importtime(stderr):
+    """Top-level imports from -X importtime: {module: cumulative us}, plus all names seen"""
+    top, seen = {}, set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line: continue
+        _, cum, name = line[len("import time:"):].split("|")
+        seen.add(name.strip())
+        if not name.startswith("  "): top[name.strip()] = int(cum)
+    return top, seen
+
+def measure(argv, env, runs, baseline):
+    """Median wall time; best-of-runs import time (least scheduler noise); modules seen"""
+    run(argv, env)  # warm bytecode caches
+    walls = [run(argv, env)[0] for _ in range(runs)]
+    imports, seen = [], set()
+    for _ in range(runs):
+        top, names = parse_importtime(run(argv, env, importtime=True)[1])
+        imports.append(sum(us for name, us in top.items() if name not in baseline) / 1000)
+        seen |= names
+    return {"cold_start_ms": round(statistics.median(walls), 1), "import_ms": round(min(imports), 1), "modules": seen}
+
+def main():
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 5
+    results, failed = {}, False
+    # Throwaway HOME: robin_daily creates its goals tree there
+    with tempfile.TemporaryDirectory(prefix="import-budget-") as home:
+        env = dict(os.environ, HOME=home, PYTHONIOENCODING="utf-8")
+        base_top, _ = parse_importtime(run(["-c", "pass"], env, importtime=True)[1])
+        interp = statistics.median(run(["-c", "pass"], env)[0] for _ in range(runs))
+
+        for name, (argv, budget, forbidden) in COMMANDS.items():
+            m = measure(argv, env, runs, set(base_top))
+            leaked = sorted(forbidden & m.pop("modules"))
+            ok = m["import_ms"] <= budget and not leaked
+            failed |= not ok
+            results[name] = dict(m, budget_ms=budget, leaked=leaked, ok=ok)
+
+    if "--json" in sys.argv:
+        print(json.dumps({"interpreter_ms": round(interp, 1), "commands": results}, ensure_ascii=False))
+    else:
+        print(f"{'command':<28}{'cold start':>12}{'imports':>10}{'budget':>8}")
+        print(f"{'(bare interpreter)':<28}{interp:>10.1f}ms")
+        for name, r in results.items():
+            flag = "" if r["ok"] else "  ❌ " + (", ".join(r["leaked"]) or "over budget")
+            print(f"{name:<28}{r['cold_start_ms']:>10.1f}ms{r['import_ms']:>8.1f}ms{r['budget_ms']:>6}ms{flag}")
+
+    summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if summary:
+        with open(summary, "a", encoding="utf-8") as f:
+            f.write("### Python cold start\n\n| command | cold start | imports | budget |\n|---|---|---|---|\n")
+            f.write(f"| (bare interpreter) | {interp:.1f} ms | | |\n")
+            for name, r in results.items():
+                mark = "✅" if r["ok"] else "❌ " + ", ".join(r["leaked"])
+                f.write(f"| `{name}` | {r['cold_start_ms']} ms | {r['import_ms']} ms | {r['budget_ms']} ms {mark} |\n")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__': main()
@@ -13,12 +13,13 @@ Usage:
     robin.check()     # Mid-day status
 """
 
-import os
+# Runs as a short-lived subprocess: keep module-level imports light.
+# argparse and the voice stack (robin_voice -> TTS/torch) load lazily.
+from __future__ import annotations
+
 import re
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
 
 # Paths - using absolute paths for reliability
 HOME = Path.home()
@@ -31,6 +32,10 @@ TEMPLATE_PATH = GOALS_DIR / "templates" / "daily.md"
 # Voice integration - robin-voice location
 VOICE_DIR = PSI_DIR / "wealth-council" / "ψ" / "lib" / "robin-voice"
 
+# Playback priority (robin-voice playback.py): lower plays first and
+# cuts off what is playing, so a celebration interrupts a routine check
+CELEBRATION_PRIORITY = 0
+
 
 class RobinDaily:
     """Robin's daily companion - tracks goals, speaks briefs"""
@@ -52,8 +57,8 @@ class RobinDaily:
             from robin_voice import RobinVoice
             self.robin_voice = RobinVoice()
 
-    def _speak(self, text: str):
-        """Speak text using Robin Voice"""
+    def _speak(self, text: str, priority: int | None = None):
+        """Speak text using Robin Voice (returns once audio is queued)"""
         if self.use_voice:
             self._load_voice()
             # Detect language and use appropriate method
@@ -61,7 +66,7 @@ class RobinDaily:
                 self.robin_voice.speak_mixed(text)
             else:
                 self.robin_voice.speak(text)
-            self.robin_voice.play()
+            self.robin_voice.play(priority=priority)
         print(f"\n🗣️ Robin: {text}\n")
 
     def _get_daily_path(self, date: str = None) -> Path:
@@ -69,7 +74,7 @@ class RobinDaily:
         date = date or self.today
         return DAILY_DIR / f"{date}.md"
 
-    def _load_daily(self, date: str = None) -> Dict:
+    def _load_daily(self, date: str = None) -> dict:
         """Load daily goals from markdown"""
         path = self._get_daily_path(date)
         if not path.exists():
@@ -99,7 +104,7 @@ class RobinDaily:
             "mood": mood_am.group(1).strip() if mood_am else "",
         }
 
-    def _get_recent_stats(self, days: int = 7) -> Dict:
+    def _get_recent_stats(self, days: int = 7) -> dict:
         """Get stats from recent days"""
         stats = {"total_goals": 0, "completed": 0, "days": 0, "streak": 0}
 
@@ -124,7 +129,7 @@ class RobinDaily:
 
         return stats
 
-    def _create_today(self, goals: List[str] = None, energy: int = None, mood: str = None):
+    def _create_today(self, goals: list[str] = None, energy: int = None, mood: str = None):
         """Create or update today's goals file"""
         path = self._get_daily_path()
 
@@ -161,7 +166,7 @@ class RobinDaily:
         path.write_text(content)
         return path
 
-    def set_goals(self, goals: List[str], energy: int = None, mood: str = None):
+    def set_goals(self, goals: list[str], energy: int = None, mood: str = None):
         """Set today's goals"""
         self._create_today(goals, energy, mood)
         print(f"✅ Goals set for {self.today}")
@@ -186,11 +191,12 @@ class RobinDaily:
             # Celebrate!
             daily = self._load_daily()
             if daily["completed"] == daily["total"]:
-                self._speak("เย้! เธอทำครบทุก goal วันนี้แล้ว! Proud of you!")
+                self._speak("เย้! เธอทำครบทุก goal วันนี้แล้ว! Proud of you!",
+                            priority=CELEBRATION_PRIORITY)
         else:
             print(f"❌ Invalid goal index: {index}")
 
-    def morning(self, goals: List[str] = None, energy: int = None, mood: str = None):
+    def morning(self, goals: list[str] = None, energy: int = None, mood: str = None):
         """
         Morning brief - start the day right
 
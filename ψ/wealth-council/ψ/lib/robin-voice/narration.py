@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Robin Narration - stream long markdown documents as speech
+
+The document is read line by line, markdown is stripped, text is packed
+into sentence chunks and split by language, and a worker thread
+synthesizes at most `prefetch` chunks ahead of the consumer (including the
+one in flight). Memory stays flat however long the document is.
+
+A Path is read as a markdown file; a str is always the text itself.
+
+Usage:
+    from pathlib import Path
+    from robin_voice import RobinVoice
+
+    robin = RobinVoice()
+    for pcm in robin.narrate(Path("ψ/learn/foo/ARCHITECTURE.md")):
+        ...  # 16-bit mono PCM at narration.SAMPLE_RATE
+    robin.narrate_to_file(Path("retro.md"), "output/retro.wav")
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import queue
+import tempfile
+import threading
+import wave
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SAMPLE_RATE = 24000  # XTTS output rate; Edge TTS is resampled to match
+MAX_CHARS = 250  # XTTS warns above ~250 chars per call
+DEFAULT_PREFETCH = 2
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+# Sentence ends; Thai has no full stop, so a space between Thai runs counts
+SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|(?<=[\u0e00-\u0e7f])\s+(?=[\u0e00-\u0e7f])")
+
+FENCE = re.compile(r"^\s*(```|~~~)")
+RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+TABLE_SEPARATOR = re.compile(r"^\s*\|?[\s:|-]+\|[\s:|-]*$")
+LINE_PREFIX = re.compile(r"^\s*(#{1,6}\s+|>\s?|[-*+]\s+(\[[ xX]\]\s+)?|\d+[.)]\s+)")
+LIST_ITEM = re.compile(r"^\s*([-*+]|\d+[.)])\s+")
+INLINE = [
+    (re.compile(r"<!--.*?-->"), ""),
+    (re.compile(r"!\[[^\]]*\]\([^)]*\)"), ""),  # images
+    (re.compile(r"\[([^\]]+)\]\([^)]*\)"), r"\1"),  # links -> text
+    (re.compile(r"\[\[([^\]|]+)(\|[^\]]+)?\]\]"), r"\1"),  # wiki links
+    (re.compile(r"https?://\S+"), ""),
+    (re.compile(r"<[^>]+>"), ""),
+    (re.compile(r"(\*\*|__|~~|\*|`)"), ""),
+]
+
+_DONE = object()
+
+
+# --- text -------------------------------------------------------------
+
+def markdown_lines(lines: Iterable[str]) -> Iterator[str | None]:
+    """Plain text lines from markdown; None marks a paragraph break"""
+    in_frontmatter = in_code = False
+    for n, line in enumerate(lines):
+        line = line.rstrip("\n")
+        if n == 0 and line.strip() == "---":
+            in_frontmatter = True
+            continue
+        if in_frontmatter:
+            in_frontmatter = line.strip() != "---"
+            continue
+        if FENCE.match(line):
+            in_code = not in_code
+            yield None
+            continue
+        if in_code:
+            continue
+        if not line.strip() or RULE.match(line) or TABLE_SEPARATOR.match(line):
+            yield None
+            continue
+
+        heading = line.lstrip().startswith("#")
+        standalone = heading or bool(LIST_ITEM.match(line))
+        text = LINE_PREFIX.sub("", line)
+        if text.lstrip().startswith("|"):
+            text = ", ".join(c.strip() for c in text.strip().strip("|").split("|") if c.strip())
+        for pattern, repl in INLINE:
+            text = pattern.sub(repl, text)
+        text = " ".join(text.split())
+        if not text:
+            continue
+
+        # Headings and list items read as their own sentences
+        if standalone and text[-1] not in ".!?…:":
+            text += "."
+        if heading:
+            yield None
+        yield text
+        if heading:
+            yield None
+
+
+def _split_long(sentence: str, max_chars: int) -> Iterator[str]:
+    """Break an overlong sentence at commas/spaces, hard-cut as a last resort"""
+    while len(sentence) > max_chars:
+        cut = sentence.rfind(", ", 0, max_chars)
+        if cut <= 0:
+            cut = sentence.rfind(" ", 0, max_chars)
+        cut = cut + 1 if cut > 0 else max_chars
+        yield sentence[:cut].strip()
+        sentence = sentence[cut:].strip()
+    if sentence:
+        yield sentence
+
+
+def text_chunks(lines: Iterable[str | None], max_chars: int = MAX_CHARS) -> Iterator[str]:
+    """Pack sentences into chunks of at most max_chars, flushing at paragraphs"""
+    buf = ""
+    for line in lines:
+        if line is None:
+            if buf:
+                yield buf
+                buf = ""
+            continue
+        for sentence in SENTENCE_END.split(line):
+            for piece in _split_long(sentence.strip(), max_chars):
+                if buf and len(buf) + 1 + len(piece) > max_chars:
+                    yield buf
+                    buf = piece
+                else:
+                    buf = f"{buf} {piece}" if buf else piece
+    if buf:
+        yield buf
+
+
+def speech_units(robin, chunks: Iterable[str]) -> Iterator[tuple]:
+    """(language, text) units; digits/punctuation stay with their neighbour"""
+    for chunk in chunks:
+        units = []
+        for lang, text in robin._split_by_language(chunk):
+            if units and not any(c.isalpha() for c in text):
+                units[-1] = (units[-1][0], f"{units[-1][1]} {text}")
+            elif units and units[-1][0] == lang:
+                units[-1] = (lang, f"{units[-1][1]} {text}")
+            else:
+                units.append((lang, text))
+        yield from units
+
+
+def source_lines(source: Path | str) -> Iterator[str]:
+    """Lines of a markdown file if source is a Path (read lazily), else of the text"""
+    if isinstance(source, Path):
+        with open(source, encoding="utf-8", errors="replace") as f:
+            yield from f
+    else:
+        yield from source.splitlines()
+
+
+# --- audio ------------------------------------------------------------
+
+def decode_pcm(path: str) -> bytes:
+    """16-bit mono PCM at SAMPLE_RATE (ffmpeg unless already in that format)"""
+    try:
+        with wave.open(path, "rb") as w:
+            if (w.getnchannels(), w.getsampwidth(), w.getframerate()) == (1, 2, SAMPLE_RATE):
+                return w.readframes(w.getnframes())
+    except (wave.Error, EOFError):
+        pass  # e.g. Edge TTS writes MP3 data
+
+    import subprocess
+    r = subprocess.run([
+        "ffmpeg", "-v", "error", "-i", path,
+        "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"
+    ], capture_output=True)
+    if r.returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode {path}: {r.stderr.decode().strip()}")
+    return r.stdout
+
+
+def _synthesize(robin, lang: str, text: str, voice: str | None) -> bytes:
+    """One unit -> PCM, through a temp file that is removed right away"""
+    fd, path = tempfile.mkstemp(prefix="narrate_", suffix=".wav", dir=OUTPUT_DIR)
+    os.close(fd)
+    last_output = robin._last_output  # _speak_* would point it at the temp file
+    try:
+        if lang == "thai":
+            robin._speak_thai(text, path, voice)
+        else:
+            robin._speak_english(text, path, voice)
+        return decode_pcm(path)
+    finally:
+        robin._last_output = last_output
+        os.remove(path)
+
+
+def narrate(robin, source: Path | str, voice: str | None = None,
+            prefetch: int = DEFAULT_PREFETCH) -> Iterator[bytes]:
+    """
+    Yield PCM chunks for a markdown file or text, synthesized ahead
+
+    Args:
+        robin: RobinVoice used for synthesis
+        source: Path of a markdown file, or the text itself (str)
+        voice: Voice profile (default: robin.voice)
+        prefetch: Max chunks synthesized but not yet taken by the
+                  consumer, counting the one in flight
+
+    Yields:
+        16-bit mono PCM bytes at SAMPLE_RATE, one chunk per speech unit
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    units = speech_units(robin, text_chunks(markdown_lines(source_lines(source))))
+    ready = queue.Queue()
+    slots = threading.Semaphore(max(1, prefetch))  # taken before synthesis starts
+    stop = threading.Event()
+
+    def claim_slot() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def work():
+        try:
+            for lang, text in units:
+                if not claim_slot():
+                    return
+                ready.put(_synthesize(robin, lang, text, voice))
+            ready.put(_DONE)
+        except Exception as e:
+            ready.put(e)
+        finally:
+            units.close()
+
+    worker = threading.Thread(target=work, name="robin-narrate", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+def narrate_to_file(robin, source, output_path: str, voice: str | None = None,
+                    prefetch: int = DEFAULT_PREFETCH) -> str:
+    """Narrate into one WAV, appending each chunk as soon as it is ready"""
+    with wave.open(output_path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        for pcm in narrate(robin, source, voice, prefetch):
+            w.writeframes(pcm)  # header is patched on every write
+    return output_path
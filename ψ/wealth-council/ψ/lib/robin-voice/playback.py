@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Robin Playback - non-blocking audio queue shared across processes
+
+Callers drop a ticket into output/.queue/ and return immediately. One
+detached drainer process plays tickets in order:
+lowest priority number first, FIFO within a priority. A ticket with a
+higher priority (lower number) stops whatever is playing - a celebration
+cuts off a routine check. Preempted audio is dropped, not resumed.
+Clips queued with remove=True belong to the queue and are deleted once
+played, stopped or cancelled.
+
+Sinks (ROBIN_AUDIO_SINK): "null" plays silently for the clip's duration
+(headless/CI), any other value is used as the player command. Default:
+afplay on macOS, aplay on Linux, null if neither is installed. If the
+player cannot start, the ticket is logged and dropped.
+
+ROBIN_PLAYBACK_QUEUE overrides the queue directory (tests).
+
+Usage:
+    from playback import enqueue, cancel, wait, HIGH
+
+    ticket = enqueue("output/robin.wav")          # returns at once
+    enqueue("output/yay.wav", priority=HIGH)      # preempts
+    cancel(ticket)
+
+CLI:
+    python playback.py FILE [--priority N] [--wait]
+    python playback.py --stop | --status
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import shutil
+import subprocess
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process queue, play synchronously
+    fcntl = None
+
+QUEUE_DIR = Path(os.environ.get("ROBIN_PLAYBACK_QUEUE")
+                 or Path(__file__).parent / "output" / ".queue")
+LOCK_FILE = QUEUE_DIR / ".lock"
+CURRENT_FILE = QUEUE_DIR / ".current"
+PID_FILE = QUEUE_DIR / ".drainer"  # liveness; the lock only serializes drainers
+LOG_FILE = QUEUE_DIR / "player.log"
+
+HIGH, NORMAL, LOW = 0, 5, 9
+POLL_SECONDS = 0.05
+DRAINER_GRACE = 2.0  # wait() gives up after this long with no drainer running
+LOG_MAX_BYTES = 256 * 1024  # player.log rotates to player.log.1 beyond this
+
+
+def _sink() -> list | None:
+    """Player command prefix, or None for the null sink"""
+    sink = os.environ.get("ROBIN_AUDIO_SINK")
+    if sink:
+        return None if sink == "null" else sink.split()
+    for player in ("afplay",) if sys.platform == "darwin" else ("aplay",):
+        if shutil.which(player):
+            return [player]
+    return None
+
+
+def _duration(path: str) -> float:
+    """WAV duration in seconds (0 if unreadable)"""
+    import wave
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return 0.0
+
+
+def _play_now(path: str):
+    """Blocking playback (fallback where the queue is unavailable)"""
+    if sys.platform == "win32":
+        import winsound
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+        return
+    sink = _sink()
+    if sink is None:
+        time.sleep(_duration(path))
+    else:
+        subprocess.run(sink + [path], check=True)
+
+
+# --- queue ------------------------------------------------------------
+
+def enqueue(path: str, priority: int = NORMAL, remove: bool = False) -> str | None:
+    """
+    Queue audio for playback and return immediately
+
+    Args:
+        path: Audio file (must stay on disk, unchanged, until played)
+        priority: 0 (HIGH) - 9 (LOW); lower plays first and preempts
+        remove: Delete the file once it has played (or was dropped)
+
+    Returns:
+        Ticket id for cancel()/wait(), or None if played synchronously
+    """
+    if not 0 <= priority <= 9:
+        raise ValueError(f"priority must be 0-9, got {priority}")
+    if fcntl is None:
+        _play_now(path)
+        if remove:
+            os.remove(path)
+        return None
+
+    QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    ticket = f"{priority}-{time.time_ns()}-{os.getpid()}"
+    tmp = QUEUE_DIR / f"{ticket}.tmp"
+    tmp.write_text(json.dumps({"path": str(Path(path).resolve()), "remove": remove}))
+    os.replace(tmp, QUEUE_DIR / f"{ticket}.json")
+    _ensure_drainer()
+    return ticket
+
+
+def _ensure_drainer():
+    """Start a detached drainer unless one is running"""
+    if _drainer_running():
+        return  # it re-checks the queue before exiting
+    try:
+        if LOG_FILE.stat().st_size > LOG_MAX_BYTES:
+            os.replace(LOG_FILE, LOG_FILE.with_name(LOG_FILE.name + ".1"))
+    except FileNotFoundError:
+        pass
+    with open(LOG_FILE, "a") as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--drain"],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            start_new_session=True,
+        )
+
+
+def _read_ticket(entry: Path) -> dict:
+    """Ticket contents; FileNotFoundError if it was taken meanwhile"""
+    return json.loads(entry.read_text())
+
+
+def _discard(entry: Path) -> bool:
+    """Take a queued ticket off the queue (deleting an owned clip); False if gone"""
+    taken = entry.with_suffix(".dropped")
+    try:
+        os.rename(entry, taken)  # atomic: the drainer cannot start it now
+    except FileNotFoundError:
+        return False
+    try:
+        ticket = _read_ticket(taken)
+        if ticket["remove"]:
+            Path(ticket["path"]).unlink(missing_ok=True)
+    finally:
+        taken.unlink(missing_ok=True)
+    return True
+
+
+def _next_ticket() -> Path | None:
+    queued = sorted(QUEUE_DIR.glob("*.json"))
+    return queued[0] if queued else None
+
+
+def _drainer_running() -> bool:
+    """True if the drainer named in the pid file is alive"""
+    try:
+        pid = int(PID_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False  # killed without cleaning up
+    except PermissionError:
+        pass
+    return True
+
+
+def _current() -> str | None:
+    """Ticket being played; a .current left by a killed drainer is ignored"""
+    try:
+        current = CURRENT_FILE.read_text() or None
+    except FileNotFoundError:
+        return None
+    return current if current and _drainer_running() else None
+
+
+def cancel(ticket: str) -> bool:
+    """Drop a queued ticket or stop it if playing. False if already done."""
+    if _discard(QUEUE_DIR / f"{ticket}.json"):
+        return True
+    if _current() == ticket:
+        (QUEUE_DIR / f"{ticket}.cancel").touch()
+        return True
+    return False
+
+
+def clear():
+    """Cancel everything: queued tickets and the one playing"""
+    for entry in QUEUE_DIR.glob("*.json"):
+        _discard(entry)
+    current = _current()
+    if current:
+        (QUEUE_DIR / f"{current}.cancel").touch()
+
+
+def pending(ticket: str) -> bool:
+    """True while a ticket is queued or playing"""
+    return (QUEUE_DIR / f"{ticket}.json").exists() or _current() == ticket
+
+
+def wait(ticket: str | None, timeout: float | None = None) -> bool:
+    """
+    Block until a ticket finishes
+
+    Returns False on timeout, or if the ticket is still queued but no
+    drainer has been running for DRAINER_GRACE seconds.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    idle_since = None
+    while ticket and pending(ticket):
+        now = time.monotonic()
+        if deadline is not None and now > deadline:
+            return False
+        if _drainer_running():
+            idle_since = None
+        elif idle_since is None:
+            idle_since = now
+        elif now - idle_since > DRAINER_GRACE:
+            print(f"❌ No player running for {ticket}, see {LOG_FILE}")
+            return False
+        time.sleep(POLL_SECONDS)
+    return True
+
+
+def status() -> dict:
+    return {
+        "playing": _current(),
+        "queued": [p.stem for p in sorted(QUEUE_DIR.glob("*.json"))],
+    }
+
+
+# --- drainer ----------------------------------------------------------
+
+def _play_ticket(entry: Path):
+    """Play one ticket, stopping early on cancel or preemption"""
+    ticket = entry.stem
+    try:
+        queued = _read_ticket(entry)
+    except FileNotFoundError:
+        return  # cancelled meanwhile
+    path = queued["path"]
+    CURRENT_FILE.write_text(ticket)  # before unlink, so pending() never gaps
+    cancel_marker = QUEUE_DIR / f"{ticket}.cancel"
+    owned = False
+    try:
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            return  # cancel() took it first
+        owned = True
+
+        print(f"▶️ {ticket} {path}", flush=True)
+        sink = _sink()
+        try:
+            proc = subprocess.Popen(sink + [path]) if sink else None
+        except OSError as e:
+            print(f"❌ Cannot start player {sink[0]!r}, dropped {ticket}: {e}", flush=True)
+            return
+        end = time.monotonic() + (0 if proc else _duration(path))
+
+        while (proc.poll() is None) if proc else (time.monotonic() < end):
+            nxt = _next_ticket()
+            if cancel_marker.exists() or (nxt and nxt.name[0] < ticket[0]):
+                if proc:
+                    proc.terminate()
+                    proc.wait()
+                print(f"⏹️ Stopped: {ticket} {path}", flush=True)
+                return
+            time.sleep(POLL_SECONDS)
+        if proc and proc.returncode:
+            print(f"❌ Player exited {proc.returncode}: {path}", flush=True)
+    finally:
+        CURRENT_FILE.unlink(missing_ok=True)
+        cancel_marker.unlink(missing_ok=True)
+        if owned and queued["remove"]:
+            Path(path).unlink(missing_ok=True)
+
+
+def drain():
+    """Play queued tickets until the queue is empty (one drainer at a time)"""
+    QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "a") as lock:
+        # Block rather than give up: a drainer that is about to exit still
+        # holds the lock, and the ticket that started us must not strand
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        CURRENT_FILE.unlink(missing_ok=True)  # stale, from a killed drainer
+        while True:
+            PID_FILE.write_text(str(os.getpid()))
+            while (entry := _next_ticket()) is not None:
+                _play_ticket(entry)
+            PID_FILE.unlink(missing_ok=True)
+            # A ticket that landed before the unlink was not given a new
+            # drainer, so look once more; later ones start their own
+            if _next_ticket() is None:
+                return
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Robin Playback queue")
+    parser.add_argument("file", nargs="?", help="Audio file to queue")
+    parser.add_argument("-p", "--priority", type=int, default=NORMAL, help="0 (high) - 9 (low)")
+    parser.add_argument("--wait", action="store_true", help="Block until played")
+    parser.add_argument("--stop", action="store_true", help="Cancel all playback")
+    parser.add_argument("--status", action="store_true", help="Show queue")
+    parser.add_argument("--drain", action="store_true", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.drain:
+        drain()
+    elif args.stop:
+        clear()
+    elif args.status:
+        print(status())
+    elif args.file:
+        ticket = enqueue(args.file, args.priority)
+        if args.wait:
+            wait(ticket)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Robin Voice - Thai + English TTS with Voice Cloning
 
 - Thai: Edge TTS (native pronunciation)
 - English: XTTS v2 (voice cloning with Norah Jones)
+- Voices: profiles in a shared VoicePool (see voice_pool.py)
 
 Usage:
     from robin_voice import RobinVoice
@@ -11,16 +12,18 @@ Usage:
     robin = RobinVoice()
     robin.speak("สวัสดีค่ะ", "thai.wav")      # Thai with Edge TTS
     robin.speak("Hello!", "english.wav")      # English with XTTS
+    robin.speak("สวัสดีค่ะ", voice="khanomtan")  # Per-request voice
     robin.play()
+    robin.narrate_to_file(Path("retro.md"))   # Long documents, streamed
 """
 
+# Imported by robin_daily on every spoken command: asyncio, subprocess and
+# the TTS/torch stack are imported where used, not at module load.
+from __future__ import annotations
+
 import os
-import sys
-import asyncio
 import re
 from pathlib import Path
-from typing import Optional
-import subprocess
 
 # Paths
 VOICE_DIR = Path(__file__).parent / "voices"
@@ -31,14 +34,22 @@ DEFAULT_VOICE = VOICE_DIR / "robin_reference.wav"
 THAI_PATTERN = re.compile(r'[\u0e00-\u0e7f]')
 
 
+def _new_output(prefix: str, suffix: str = ".wav") -> str:
+    """Unique path in OUTPUT_DIR - queued clips must never be overwritten"""
+    import time
+    return str(OUTPUT_DIR / f"{prefix}_{time.time_ns()}_{os.getpid()}{suffix}")
+
+
 class RobinVoice:
     """Hybrid TTS: Edge TTS for Thai, XTTS for English"""
 
     def __init__(
         self,
-        reference_audio: Optional[str] = None,
+        reference_audio: str | None = None,
         thai_voice: str = "th-TH-PremwadeeNeural",
         english_voice: str = "en-US-AriaNeural",
+        voice: str = "robin",
+        pool=None,
     ):
         """
         Initialize Robin Voice
@@ -47,12 +58,17 @@ class RobinVoice:
             reference_audio: Path to reference voice for XTTS (English)
             thai_voice: Edge TTS voice for Thai
             english_voice: Fallback Edge TTS voice for English
+            voice: Default voice profile name in the pool
+            pool: VoicePool to use (default: process-wide shared pool)
         """
-        self.reference = reference_audio or str(DEFAULT_VOICE)
         self.thai_voice = thai_voice
         self.english_voice = english_voice
-        self.tts = None  # Lazy load XTTS
+        self.voice = voice
+        self._pool = pool  # Lazy: models load on first synthesis
         self._last_output = None
+        self._generated = set()  # auto-named outputs, deleted once played
+        if reference_audio:
+            self.voice = self.pool.register_clip(reference_audio, prepare=False).name
 
         # Ensure directories exist
         VOICE_DIR.mkdir(parents=True, exist_ok=True)
@@ -62,14 +78,18 @@ class RobinVoice:
         """Detect if text contains Thai characters"""
         return bool(THAI_PATTERN.search(text))
 
-    def _load_xtts(self):
-        """Lazy load XTTS model"""
-        if self.tts is None:
-            print("🔄 Loading XTTS v2...")
-            os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
-            from TTS.api import TTS
-            self.tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2")
-            print("✅ XTTS loaded!")
+    @property
+    def pool(self):
+        """Voice pool holding loaded engines and speaker profiles"""
+        if self._pool is None:
+            from voice_pool import default_pool
+            self._pool = default_pool()
+        return self._pool
+
+    @property
+    def reference(self) -> str | None:
+        """Reference clip of the current voice"""
+        return self.pool.profile(self.voice).reference
 
     async def _edge_tts(self, text: str, output_path: str, voice: str):
         """Generate speech using Edge TTS"""
@@ -81,9 +101,10 @@ class RobinVoice:
     def speak(
         self,
         text: str,
-        output_path: Optional[str] = None,
+        output_path: str | None = None,
         force_thai: bool = False,
         force_english: bool = False,
+        voice: str | None = None,
     ) -> str:
         """
         Generate speech from text
@@ -97,92 +118,102 @@ class RobinVoice:
             output_path: Output WAV file path
             force_thai: Force Thai TTS
             force_english: Force English TTS
+            voice: Voice profile for this call (default: self.voice)
 
         Returns:
             Path to generated audio file
         """
         # Generate output path
         if output_path is None:
-            import time
-            timestamp = int(time.time())
-            output_path = str(OUTPUT_DIR / f"robin_{timestamp}.wav")
+            output_path = _new_output("robin")
+            self._generated.add(output_path)
 
         # Detect language
         is_thai = force_thai or (not force_english and self._is_thai(text))
 
         if is_thai:
-            return self._speak_thai(text, output_path)
+            return self._speak_thai(text, output_path, voice)
         else:
-            return self._speak_english(text, output_path)
+            return self._speak_english(text, output_path, voice)
 
-    def _speak_thai(self, text: str, output_path: str) -> str:
-        """Generate Thai speech using Edge TTS"""
+    def _speak_thai(self, text: str, output_path: str, voice: str | None = None) -> str:
+        """Generate Thai speech: the voice's Thai model if it has one, else Edge TTS"""
         print(f"🇹🇭 Thai: {text[:50]}...")
+        voice = voice or self.voice
+
+        if self.pool.profile(voice).thai_language:
+            try:
+                self.pool.synthesize(voice, text, output_path, thai=True)
+                self._last_output = output_path
+                print(f"✅ Saved ({voice}): {output_path}")
+                return output_path
+            except Exception as e:
+                print(f"⚠️ {voice} failed, falling back to Edge TTS: {e}")
 
         # Run async Edge TTS
+        import asyncio
         asyncio.run(self._edge_tts(text, output_path, self.thai_voice))
 
         self._last_output = output_path
         print(f"✅ Saved: {output_path}")
         return output_path
 
-    def _speak_english(self, text: str, output_path: str) -> str:
-        """Generate English speech using XTTS with voice cloning"""
+    def _speak_english(self, text: str, output_path: str, voice: str | None = None) -> str:
+        """Generate English speech using the voice's cloning engine (XTTS)"""
         print(f"🇺🇸 English: {text[:50]}...")
+        voice = voice or self.voice
+        profile = self.pool.profile(voice)
 
-        # Check if reference audio exists for XTTS
-        if os.path.exists(self.reference):
+        # Check if reference audio exists for cloning
+        if profile.speaker or (profile.reference and os.path.exists(profile.reference)):
             try:
-                self._load_xtts()
-                self.tts.tts_to_file(
-                    text=text,
-                    speaker_wav=self.reference,
-                    language="en",
-                    file_path=output_path
-                )
+                self.pool.synthesize(voice, text, output_path)
                 self._last_output = output_path
-                print(f"✅ Saved (XTTS): {output_path}")
+                print(f"✅ Saved ({profile.engine}): {output_path}")
                 return output_path
             except Exception as e:
                 print(f"⚠️ XTTS failed, falling back to Edge TTS: {e}")
 
         # Fallback to Edge TTS
+        import asyncio
         asyncio.run(self._edge_tts(text, output_path, self.english_voice))
         self._last_output = output_path
         print(f"✅ Saved (Edge): {output_path}")
         return output_path
 
-    def speak_mixed(self, text: str, output_path: Optional[str] = None) -> str:
+    def speak_mixed(
+        self, text: str, output_path: str | None = None, voice: str | None = None
+    ) -> str:
         """
         Handle mixed Thai/English text by splitting and combining
 
         Args:
             text: Mixed language text
             output_path: Output file path
+            voice: Voice profile for this call (default: self.voice)
 
         Returns:
             Path to combined audio
         """
         if output_path is None:
-            import time
-            timestamp = int(time.time())
-            output_path = str(OUTPUT_DIR / f"robin_mixed_{timestamp}.wav")
+            output_path = _new_output("robin_mixed")
+            self._generated.add(output_path)
 
         # Split by language (simple approach)
         segments = self._split_by_language(text)
 
         if len(segments) == 1:
             # Single language, use normal speak
-            return self.speak(text, output_path)
+            return self.speak(text, output_path, voice=voice)
 
         # Generate audio for each segment
         temp_files = []
         for i, (lang, segment_text) in enumerate(segments):
-            temp_path = str(OUTPUT_DIR / f"temp_{i}.wav")
+            temp_path = _new_output(f"temp_{i}")
             if lang == "thai":
-                self._speak_thai(segment_text, temp_path)
+                self._speak_thai(segment_text, temp_path, voice)
             else:
-                self._speak_english(segment_text, temp_path)
+                self._speak_english(segment_text, temp_path, voice)
             temp_files.append(temp_path)
 
         # Concatenate audio files
@@ -198,6 +229,39 @@ class RobinVoice:
         self._last_output = output_path
         return output_path
 
+    def narrate(self, source: Path | str, voice: str | None = None, prefetch: int = 2):
+        """
+        Stream a long markdown document (or text) as PCM chunks
+
+        Markdown is stripped, text is chunked by sentence and language,
+        and up to `prefetch` chunks are synthesized ahead (see narration.py).
+
+        Args:
+            source: Path of a markdown file, or the text itself (a str is
+                    always spoken, never opened as a file)
+            voice: Voice profile (default: self.voice)
+            prefetch: Max chunks synthesized ahead, counting the one in flight
+
+        Returns:
+            Iterator of 16-bit mono PCM bytes at narration.SAMPLE_RATE
+        """
+        from narration import narrate
+        return narrate(self, source, voice, prefetch)
+
+    def narrate_to_file(
+        self, source: Path | str, output_path: str | None = None, voice: str | None = None, prefetch: int = 2
+    ) -> str:
+        """Narrate into one WAV, written progressively chunk by chunk"""
+        from narration import narrate_to_file
+
+        if output_path is None:
+            output_path = _new_output("robin_narration")
+            self._generated.add(output_path)
+        narrate_to_file(self, source, output_path, voice, prefetch)
+        self._last_output = output_path
+        print(f"✅ Saved narration: {output_path}")
+        return output_path
+
     def _split_by_language(self, text: str) -> list:
         """Split text into (language, text) segments"""
         segments = []
@@ -226,8 +290,10 @@ class RobinVoice:
 
     def _concat_audio(self, input_files: list, output_path: str):
         """Concatenate audio files using ffmpeg"""
+        import subprocess
+
         # Create file list
-        list_file = str(OUTPUT_DIR / "concat_list.txt")
+        list_file = _new_output("concat_list", ".txt")
         with open(list_file, "w") as f:
             for file in input_files:
                 f.write(f"file '{file}'\n")
@@ -240,37 +306,81 @@ class RobinVoice:
 
         os.remove(list_file)
 
-    def play(self, audio_path: Optional[str] = None):
-        """Play the generated audio"""
+    def play(
+        self, audio_path: str | None = None, priority: int | None = None, wait: bool = False
+    ) -> str | None:
+        """
+        Queue the generated audio for playback (see playback.py)
+
+        Returns as soon as the clip is queued; clips play in order, and a
+        higher priority (lower number, e.g. playback.HIGH) cuts off what
+        is playing. A clip generated without an explicit output_path is
+        handed over to the queue and deleted once played.
+
+        Args:
+            audio_path: File to play (default: last generated)
+            priority: 0 (high) - 9 (low), default playback.NORMAL
+            wait: Block until this clip has finished
+
+        Returns:
+            Ticket id for playback.cancel(), or None
+        """
         path = audio_path or self._last_output
         if not path or not os.path.exists(path):
             print("❌ No audio to play")
-            return
-
-        print(f"🔊 Playing: {path}")
-
-        if sys.platform == "darwin":
-            subprocess.run(["afplay", path], check=True)
-        elif sys.platform == "linux":
-            subprocess.run(["aplay", path], check=True)
-        elif sys.platform == "win32":
-            import winsound
-            winsound.PlaySound(path, winsound.SND_FILENAME)
-
-    def set_voice(self, reference_audio: str):
-        """Change the reference voice for XTTS"""
-        if not os.path.exists(reference_audio):
-            raise FileNotFoundError(f"Voice file not found: {reference_audio}")
-        self.reference = reference_audio
-        self.tts = None  # Reset to reload with new voice
-        print(f"🎭 Voice changed: {reference_audio}")
+            return None
+
+        import playback
+
+        remove = path in self._generated
+        if remove:
+            self._generated.discard(path)
+            if path == self._last_output:
+                self._last_output = None  # the drainer owns it now
+
+        print(f"🔊 Queued: {path}")
+        ticket = playback.enqueue(path, playback.NORMAL if priority is None else priority, remove)
+        if wait:
+            playback.wait(ticket)
+        return ticket
+
+    def stop(self):
+        """Stop playback and drop everything queued"""
+        import playback
+        playback.clear()
+
+    def set_voice(self, voice: str):
+        """
+        Change the default voice
+
+        Args:
+            voice: A registered profile name, or a reference WAV path.
+                   A new clip is validated and preprocessed once (see
+                   voice_prep) and registered as a profile named by its
+                   resolved path, so it never replaces a built-in voice.
+
+        Loaded models stay resident - only the speaker changes.
+
+        Raises:
+            FileNotFoundError: reference file does not exist
+            ValueError: clip is too short to clone from
+        """
+        try:
+            self.pool.profile(voice)
+        except KeyError:
+            voice = self.pool.register_clip(voice).name
+        self.voice = voice
+        print(f"🎭 Voice changed: {voice}")
 
     def list_voices(self) -> dict:
         """List available voices"""
+        reference = self.reference
         return {
             "thai": self.thai_voice,
-            "english_clone": self.reference if os.path.exists(self.reference) else None,
+            "english_clone": reference if reference and os.path.exists(reference) else None,
             "english_fallback": self.english_voice,
+            "voice": self.voice,
+            "profiles": ", ".join(self.pool.status()["voices"]),
         }
 
 
@@ -281,15 +391,19 @@ def main():
     parser = argparse.ArgumentParser(description="Robin Voice - Thai/English TTS")
     parser.add_argument("text", nargs="?", help="Text to speak")
     parser.add_argument("-o", "--output", help="Output file path")
-    parser.add_argument("-v", "--voice", help="Reference voice for English")
+    parser.add_argument("-v", "--voice", help="Voice profile name or reference WAV")
     parser.add_argument("--thai", action="store_true", help="Force Thai TTS")
     parser.add_argument("--english", action="store_true", help="Force English TTS")
     parser.add_argument("--play", action="store_true", help="Play after generation")
+    parser.add_argument("--wait", action="store_true", help="With --play, block until played")
     parser.add_argument("--list-voices", action="store_true", help="List available voices")
+    parser.add_argument("--narrate", metavar="FILE", help="Narrate a markdown file")
 
     args = parser.parse_args()
 
-    robin = RobinVoice(reference_audio=args.voice)
+    robin = RobinVoice()
+    if args.voice:
+        robin.set_voice(args.voice)
 
     if args.list_voices:
         voices = robin.list_voices()
@@ -298,6 +412,12 @@ def main():
             print(f"  {k}: {v}")
         return
 
+    if args.narrate:
+        robin.narrate_to_file(Path(args.narrate), args.output)
+        if args.play:
+            robin.play(wait=args.wait)
+        return
+
     if not args.text:
         # Interactive mode
         print("🎙️ Robin Voice - Interactive Mode")
@@ -319,7 +439,7 @@ def main():
             force_english=args.english
         )
         if args.play:
-            robin.play()
+            robin.play(wait=args.wait)
 
 
 if __name__ == "__main__":
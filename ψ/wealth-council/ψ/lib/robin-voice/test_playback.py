@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Playback queue tests - null sink, temporary queue dir, real drainer processes
+
+Run: python -m unittest test_playback   (from this directory)
+"""
+
+import os
+import sys
+import json
+import time
+import wave
+import shutil
+import tempfile
+import subprocess
+import importlib
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import playback
+
+
+def _wav(path: Path, seconds: float) -> str:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(b"\0\0" * int(8000 * seconds))
+    return str(path)
+
+
+@unittest.skipIf(playback.fcntl is None, "queue needs fcntl")
+class PlaybackQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="robin-playback-"))
+        self._env = {k: os.environ.get(k) for k in ("ROBIN_PLAYBACK_QUEUE", "ROBIN_AUDIO_SINK")}
+        os.environ["ROBIN_PLAYBACK_QUEUE"] = str(self.tmp / "queue")
+        os.environ["ROBIN_AUDIO_SINK"] = "null"
+        self.pb = importlib.reload(playback)
+        self.short = _wav(self.tmp / "short.wav", 0.2)
+        self.long = _wav(self.tmp / "long.wav", 3.0)
+
+    def tearDown(self):
+        self.pb.clear()
+        deadline = time.monotonic() + 5
+        while self.pb._drainer_running() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        for k, v in self._env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        importlib.reload(playback)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _played(self) -> list:
+        """Tickets in the order the drainer started them"""
+        log = self.pb.LOG_FILE.read_text() if self.pb.LOG_FILE.exists() else ""
+        return [line.split()[1] for line in log.splitlines() if line.startswith("▶️")]
+
+    def _wait_playing(self, ticket: str):
+        deadline = time.monotonic() + 5
+        while self.pb.status()["playing"] != ticket:
+            self.assertLess(time.monotonic(), deadline, "ticket never started")
+            time.sleep(0.02)
+
+    def test_enqueue_returns_before_playback(self):
+        start = time.monotonic()
+        ticket = self.pb.enqueue(self.long)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertTrue(self.pb.pending(ticket))
+
+    def test_priority_then_fifo_order(self):
+        first = self.pb.enqueue(self.short)
+        self._wait_playing(first)
+        low = self.pb.enqueue(self.short, self.pb.LOW)
+        normal = self.pb.enqueue(self.short)
+        high = self.pb.enqueue(self.short, self.pb.HIGH)  # preempts first
+        self.assertTrue(self.pb.wait(low, timeout=10))
+        self.assertEqual(self._played(), [first, high, normal, low])
+
+    def test_higher_priority_preempts(self):
+        routine = self.pb.enqueue(self.long)
+        self._wait_playing(routine)
+        start = time.monotonic()
+        celebration = self.pb.enqueue(self.short, self.pb.HIGH)
+        self.assertTrue(self.pb.wait(celebration, timeout=5))
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertFalse(self.pb.pending(routine))  # dropped, not resumed
+        self.assertIn(f"⏹️ Stopped: {routine}", self.pb.LOG_FILE.read_text())
+
+    def test_cancel_queued_and_playing(self):
+        playing = self.pb.enqueue(self.long)
+        self._wait_playing(playing)
+        queued = self.pb.enqueue(self.long)
+        self.assertTrue(self.pb.cancel(queued))
+        self.assertTrue(self.pb.cancel(playing))
+        self.assertTrue(self.pb.wait(playing, timeout=2))
+        self.assertNotIn(queued, self._played())
+        self.assertFalse(self.pb.cancel(playing))  # already done
+
+    def test_wait_timeout(self):
+        ticket = self.pb.enqueue(self.long)
+        self.assertFalse(self.pb.wait(ticket, timeout=0.3))
+        self.assertTrue(self.pb.wait(ticket, timeout=10))
+
+    def test_missing_player_drops_ticket_and_keeps_draining(self):
+        os.environ["ROBIN_AUDIO_SINK"] = str(self.tmp / "no-such-player")
+        first = self.pb.enqueue(self.short)
+        second = self.pb.enqueue(self.short)
+        self.assertTrue(self.pb.wait(second, timeout=5))
+        self.assertEqual(list(self.pb.QUEUE_DIR.glob("*.json")), [])
+        self.assertIn("Cannot start player", self.pb.LOG_FILE.read_text())
+        self.assertEqual(self._played(), [first, second])
+
+    def test_owned_clips_are_deleted_once_played(self):
+        owned = _wav(self.tmp / "owned.wav", 0.1)
+        kept = self.pb.enqueue(self.short)
+        self.assertTrue(self.pb.wait(self.pb.enqueue(owned, remove=True), timeout=5))
+        self.assertTrue(self.pb.wait(kept, timeout=5))
+        self.assertFalse(os.path.exists(owned))
+        self.assertTrue(os.path.exists(self.short))
+
+    def test_cancelled_owned_clip_is_deleted(self):
+        self._wait_playing(self.pb.enqueue(self.long))
+        owned = _wav(self.tmp / "owned.wav", 0.1)
+        self.assertTrue(self.pb.cancel(self.pb.enqueue(owned, remove=True)))
+        self.assertFalse(os.path.exists(owned))
+
+    def test_lock_holder_is_not_a_drainer(self):
+        self.pb.QUEUE_DIR.mkdir(parents=True)
+        with open(self.pb.LOCK_FILE, "a") as lock:  # e.g. a drainer about to exit
+            self.pb.fcntl.flock(lock, self.pb.fcntl.LOCK_EX)
+            self.assertFalse(self.pb._drainer_running())
+            ticket = self.pb.enqueue(self.short)  # still spawns a drainer
+        self.assertTrue(self.pb.wait(ticket, timeout=5))
+
+    def test_dead_drainer_pid_is_ignored(self):
+        self.pb.QUEUE_DIR.mkdir(parents=True)
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        self.pb.PID_FILE.write_text(str(dead.pid))  # drainer killed mid-play
+        self.assertTrue(self.pb.wait(self.pb.enqueue(self.short), timeout=5))
+
+    def test_log_rotates_when_a_drainer_starts(self):
+        self.pb.QUEUE_DIR.mkdir(parents=True)
+        self.pb.LOG_FILE.write_text("x" * (self.pb.LOG_MAX_BYTES + 1))
+        ticket = self.pb.enqueue(self.short)
+        self.assertTrue(self.pb.wait(ticket, timeout=5))
+        self.assertEqual(self._played(), [ticket])
+        rotated = self.pb.LOG_FILE.with_name("player.log.1")
+        self.assertEqual(rotated.stat().st_size, self.pb.LOG_MAX_BYTES + 1)
+
+    def test_wait_gives_up_without_drainer(self):
+        self.pb.QUEUE_DIR.mkdir(parents=True)
+        orphan = "5-0-0"
+        (self.pb.QUEUE_DIR / f"{orphan}.json").write_text(
+            json.dumps({"path": self.short, "remove": False}))
+        self.pb.DRAINER_GRACE = 0.2
+        start = time.monotonic()
+        self.assertFalse(self.pb.wait(orphan))
+        self.assertLess(time.monotonic() - start, 2.0)
+
+    def test_stale_current_is_ignored(self):
+        self.pb.QUEUE_DIR.mkdir(parents=True)
+        self.pb.CURRENT_FILE.write_text("5-0-0")  # left by a killed drainer
+        self.assertFalse(self.pb.pending("5-0-0"))
+        self.assertTrue(self.pb.wait("5-0-0", timeout=1))
+        self.assertIsNone(self.pb.status()["playing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Voice Pool - shared TTS engines + speaker profiles with LRU residency
+
+Engines (XTTS v2, local models under models/) load lazily and stay
+resident until the memory budget forces the least recently used one out.
+Speaker profiles are just (engine, reference, language) records, so many
+speakers share one loaded XTTS model and switching voice never reloads.
+
+Usage:
+    from voice_pool import default_pool
+
+    pool = default_pool()
+    pool.register("narrator", reference="voices/narrator.wav")
+    pool.synthesize("narrator", "Hello!", "out.wav")
+    clip = pool.register_clip("voices/guest.wav")  # named by resolved path
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import gc
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+MODELS_DIR = Path(__file__).parent / "models"
+DEFAULT_VOICE = Path(__file__).parent / "voices" / "robin_reference.wav"
+
+# Rough resident size per engine; replaced by the real parameter size once loaded
+ENGINES = {
+    "xtts_v2": {"model": "tts_models/multilingual/multi-dataset/xtts_v2", "mb": 2000},
+    "khanomtan": {"path": MODELS_DIR / "khanomtan-tts-v1.0", "mb": 400},
+}
+
+DEFAULT_BUDGET_MB = int(os.environ.get("ROBIN_VOICE_BUDGET_MB", "4096"))
+
+
+class VoiceProfile:
+    """A speaker: which engine, which reference clip, which languages"""
+
+    __slots__ = ("name", "engine", "reference", "language", "thai_language", "speaker")
+
+    def __init__(
+        self,
+        name: str,
+        engine: str = "xtts_v2",
+        reference: str | None = None,
+        language: str = "en",
+        thai_language: str | None = None,  # None = Thai goes to Edge TTS
+        speaker: str | None = None,  # Named speaker for multi-speaker models
+    ):
+        self.name = name
+        self.engine = engine
+        self.reference = reference
+        self.language = language
+        self.thai_language = thai_language
+        self.speaker = speaker
+
+    def __repr__(self):
+        return f"VoiceProfile({self.name!r}, engine={self.engine!r}, reference={self.reference!r})"
+
+
+class VoicePool:
+    """Engines kept resident under a memory budget, evicted LRU"""
+
+    def __init__(self, budget_mb: int = DEFAULT_BUDGET_MB):
+        self.budget_mb = budget_mb
+        self._engines = OrderedDict()  # name -> (tts, mb), most recent last
+        self._profiles = {}  # name -> VoiceProfile
+        self._prepared = {}  # reference path -> preprocessed wav
+        self._pinned = set()  # built-ins: never replaced
+        self._lock = threading.RLock()
+
+        self.register("robin", reference=str(DEFAULT_VOICE), pinned=True)
+        self.register("khanomtan", engine="khanomtan", reference=str(DEFAULT_VOICE),
+                      thai_language="th-th", pinned=True)
+
+    # --- profiles -----------------------------------------------------
+
+    def register(self, name: str, engine: str = "xtts_v2", prepare: bool = False,
+                 pinned: bool = False, **fields) -> VoiceProfile:
+        """
+        Add or replace a speaker profile (no model is loaded)
+
+        With prepare=True the reference clip is validated and preprocessed
+        first, so a bad clip raises before the profile is registered.
+        Pinned profiles (the built-ins) cannot be replaced - registering
+        over one raises ValueError. Profiles are small records and are
+        kept for the life of the pool, so a RobinVoice never loses its voice.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine} (have: {', '.join(ENGINES)})")
+        with self._lock:
+            if name in self._pinned:
+                raise ValueError(f"Voice {name!r} is built in and cannot be replaced")
+            profile = VoiceProfile(name=name, engine=engine, **fields)
+            if prepare:
+                self.reference_for(profile)
+            self._profiles[name] = profile
+            if pinned:
+                self._pinned.add(name)
+            return profile
+
+    def register_clip(self, reference: str, prepare: bool = True) -> VoiceProfile:
+        """
+        XTTS profile for a reference clip, named by its resolved path
+
+        Keying by path means a clip can never shadow a built-in or another
+        clip with the same file name. Re-registering a clip reuses its profile.
+        """
+        name = str(Path(reference).resolve())
+        with self._lock:
+            if name in self._profiles:
+                return self.profile(name)
+            return self.register(name, reference=reference, prepare=prepare)
+
+    def profile(self, name: str) -> VoiceProfile:
+        """Look up a profile by name (KeyError if unknown)"""
+        with self._lock:
+            if name not in self._profiles:
+                raise KeyError(f"Unknown voice: {name}")
+            return self._profiles[name]
+
+    def reference_for(self, profile: VoiceProfile) -> str | None:
+        """Preprocessed reference clip for a profile (memoized)"""
+        if not profile.reference:
+            return None
+        with self._lock:
+            if profile.reference not in self._prepared:
+                from voice_prep import prepare_reference
+                self._prepared[profile.reference] = prepare_reference(profile.reference)
+            return self._prepared[profile.reference]
+
+    # --- engines ------------------------------------------------------
+
+    def engine(self, name: str):
+        """Return a loaded engine, loading (and evicting LRU) if needed"""
+        with self._lock:
+            if name in self._engines:
+                self._engines.move_to_end(name)
+                return self._engines[name][0]
+
+            spec = ENGINES[name]
+            self._evict_for(spec["mb"])
+            tts = self._load(name, spec)
+            self._engines[name] = (tts, self._measure_mb(tts, spec["mb"]))
+            self._evict_for(0, keep=1)  # real size may exceed the estimate
+            return tts
+
+    def _load(self, name: str, spec: dict):
+        print(f"🔄 Loading {name}...")
+        os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
+        from TTS.api import TTS
+
+        if "model" in spec:
+            tts = TTS(spec["model"])
+        else:
+            model_dir = Path(spec["path"])
+            checkpoints = sorted(p for p in model_dir.glob("*.pth") if "speakers" not in p.name)
+            if not checkpoints or not (model_dir / "config.json").exists():
+                raise FileNotFoundError(f"No model checkpoint/config.json in {model_dir}")
+            tts = TTS(model_path=str(checkpoints[0]), config_path=str(model_dir / "config.json"))
+        print(f"✅ {name} loaded!")
+        return tts
+
+    def _measure_mb(self, tts, estimate: int) -> int:
+        """Parameter size of a loaded model, or the estimate if unavailable"""
+        try:
+            model = tts.synthesizer.tts_model
+            size = sum(p.numel() * p.element_size() for p in model.parameters())
+            return max(1, size // (1 << 20))
+        except Exception:
+            return estimate
+
+    def _evict_for(self, need_mb: int, keep: int = 0):
+        """Drop least recently used engines until need_mb fits in the budget"""
+        evicted = False
+        while len(self._engines) > keep and self.resident_mb() + need_mb > self.budget_mb:
+            name, _ = self._engines.popitem(last=False)
+            print(f"♻️ Evicted {name}")
+            evicted = True
+        if evicted:
+            gc.collect()
+            torch = sys.modules.get("torch")
+            if torch is not None and torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    def resident_mb(self) -> int:
+        return sum(mb for _, mb in self._engines.values())
+
+    # --- synthesis ----------------------------------------------------
+
+    def synthesize(self, voice: str, text: str, output_path: str, thai: bool = False) -> str:
+        """Synthesize text with a profile's engine and speaker"""
+        profile = self.profile(voice)
+        language = profile.thai_language if thai else profile.language
+        speaker_wav = self.reference_for(profile)
+        tts = self.engine(profile.engine)
+
+        kwargs = {"text": text, "file_path": output_path}
+        if profile.speaker:
+            kwargs["speaker"] = profile.speaker
+        elif speaker_wav:
+            kwargs["speaker_wav"] = speaker_wav
+        if getattr(tts, "is_multi_lingual", True):
+            kwargs["language"] = language
+        tts.tts_to_file(**kwargs)
+        return output_path
+
+    def status(self) -> dict:
+        """Resident engines and registered voices"""
+        with self._lock:
+            return {
+                "budget_mb": self.budget_mb,
+                "resident_mb": self.resident_mb(),
+                "engines": {name: mb for name, (_, mb) in self._engines.items()},
+                "voices": {name: p.engine for name, p in self._profiles.items()},
+            }
+
+
+_default_pool = None
+
+
+def default_pool() -> VoicePool:
+    """Process-wide pool shared by every RobinVoice"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = VoicePool()
+    return _default_pool
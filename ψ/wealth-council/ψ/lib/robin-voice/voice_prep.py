@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Reference audio preprocessing for XTTS voice cloning
+
+Trims silence, downmixes to mono, resamples, normalizes loudness and
+writes 16-bit PCM - once per clip. Results are cached by content hash,
+so XTTS never re-decodes a long stereo 48kHz file on every call.
+
+Usage:
+    from voice_prep import prepare_reference
+
+    wav = prepare_reference("voices/robin_reference.wav")  # cached path
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+import shutil
+import subprocess
+import tempfile
+import wave
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / "voices" / ".prepared"
+
+# Reference spec (see README): 6-30s, mono, 16-bit
+MIN_SECONDS = 6.0
+HARD_MIN_SECONDS = 3.0  # below this cloning is unusable - reject
+MAX_SECONDS = 30.0
+SAMPLE_RATE = 22050  # XTTS conditioning rate
+LOUDNESS_LUFS = -23
+
+# Bump when the filter chain changes so stale cache entries are ignored
+PIPELINE_VERSION = 1
+
+FILTERS = ",".join([
+    # Trim leading and trailing silence (reverse trick for the tail)
+    "silenceremove=start_periods=1:start_threshold=-50dB:start_silence=0.1",
+    "areverse",
+    "silenceremove=start_periods=1:start_threshold=-50dB:start_silence=0.1",
+    "areverse",
+    f"atrim=end={MAX_SECONDS}",
+    f"loudnorm=I={LOUDNESS_LUFS}:TP=-2:LRA=11",
+])
+
+
+def _hash_file(path: str) -> str:
+    """sha1 of file content, read in chunks"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def probe(path: str) -> dict:
+    """Return {duration, channels, sample_rate, bits} for an audio file"""
+    try:
+        with wave.open(path, "rb") as w:
+            return {
+                "duration": w.getnframes() / w.getframerate(),
+                "channels": w.getnchannels(),
+                "sample_rate": w.getframerate(),
+                "bits": w.getsampwidth() * 8,
+            }
+    except (wave.Error, EOFError):
+        pass
+
+    # Not a plain PCM WAV - ask ffprobe
+    if not shutil.which("ffprobe"):
+        raise ValueError(f"Cannot read {path}: not a PCM WAV and ffprobe not found")
+    r = subprocess.run([
+        "ffprobe", "-v", "error", "-select_streams", "a:0",
+        "-show_entries", "stream=channels,sample_rate,bits_per_sample:format=duration",
+        "-of", "json", path
+    ], capture_output=True, text=True)
+    info = json.loads(r.stdout or "{}")
+    streams = info.get("streams") or [{}]
+    return {
+        "duration": float(info.get("format", {}).get("duration", 0)),
+        "channels": int(streams[0].get("channels", 0)),
+        "sample_rate": int(streams[0].get("sample_rate", 0)),
+        "bits": int(streams[0].get("bits_per_sample", 0)),
+    }
+
+
+def _in_spec(info: dict) -> bool:
+    return (info["channels"] == 1 and info["bits"] == 16
+            and MIN_SECONDS <= info["duration"] <= MAX_SECONDS)
+
+
+def _check_duration(path: str, duration: float):
+    """Reject unusably short clips, warn on out-of-spec ones"""
+    if duration < HARD_MIN_SECONDS:
+        raise ValueError(
+            f"Reference too short ({duration:.1f}s < {HARD_MIN_SECONDS:.0f}s): {path}"
+        )
+    if duration < MIN_SECONDS:
+        print(f"⚠️ Reference is {duration:.1f}s (recommended {MIN_SECONDS:.0f}-{MAX_SECONDS:.0f}s): {path}")
+
+
+def prepare_reference(path: str) -> str:
+    """
+    Preprocess a reference clip once and return the cached WAV path
+
+    Args:
+        path: Reference audio (any format ffmpeg can decode)
+
+    Returns:
+        Path to a trimmed, mono, 16-bit, loudness-normalized WAV.
+        Falls back to the original file if ffmpeg is unavailable.
+
+    Raises:
+        FileNotFoundError: path does not exist
+        ValueError: clip is too short to clone from
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Voice file not found: {path}")
+
+    cached = CACHE_DIR / f"{_hash_file(path)}_v{PIPELINE_VERSION}.wav"
+    if cached.exists():
+        return str(cached)
+
+    info = probe(path)
+
+    if not shutil.which("ffmpeg"):
+        _check_duration(path, info["duration"])
+        if info["duration"] > MAX_SECONDS:
+            print(f"⚠️ Reference is {info['duration']:.1f}s (recommended ≤{MAX_SECONDS:.0f}s) "
+                  f"and ffmpeg is not installed to trim it: {path}")
+        if not _in_spec(info):
+            print(f"⚠️ ffmpeg not found, using unprocessed reference "
+                  f"({info['channels']}ch {info['bits']}-bit {info['sample_rate']}Hz)")
+        return path
+
+    if info["duration"] > MAX_SECONDS:
+        print(f"⚠️ Reference is {info['duration']:.1f}s, using first {MAX_SECONDS:.0f}s: {path}")
+
+    print(f"🎚️ Preparing reference: {path}")
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Unique temp name: concurrent processes may prepare the same clip
+    fd, tmp = tempfile.mkstemp(prefix=f"{cached.stem}.", suffix=".tmp.wav", dir=CACHE_DIR)
+    os.close(fd)
+    tmp = Path(tmp)
+    r = subprocess.run([
+        "ffmpeg", "-y", "-v", "error", "-i", path,
+        "-af", FILTERS, "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "-c:a", "pcm_s16le", str(tmp)
+    ], capture_output=True, text=True)
+    if r.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        raise ValueError(f"Could not preprocess {path}: {r.stderr.strip()}")
+
+    try:
+        _check_duration(path, probe(str(tmp))["duration"])
+    except ValueError:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, cached)
+    print(f"✅ Reference ready: {cached}")
+    return str(cached)